@@ -1,14 +1,22 @@
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Union, BinaryIO
 import os
-import copy
+import re
+import io
+import functools
+import math
+import textwrap
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-from PyPDF2 import PdfReader, PdfWriter
+from pdfrw import PdfReader
+from pdfrw.buildxobj import pagexobj
+from pdfrw.toreportlab import makerl
 
 # Page size for initial layout guesses
 pw, ph = A4
@@ -41,6 +49,7 @@ layout = {
 
     # Optional: detail line leading and wrapping for single-line descriptions
     "DETAIL_LINE_LEADING": 11,  # px; if omitted uses FONT_SIZE_MAIN+2
+    "WRAP_WIDTH": 78 * mm,  # wrap by rendered width (stays clear of the quantity column); None -> use WRAP_CHARS
     "WRAP_CHARS": 70,
 
     # Fonts (paths or built-in names). If paths are invalid, falls back to Helvetica.
@@ -83,25 +92,37 @@ FS_SMALL = int(layout.get("FONT_SIZE_SMALL", FS_MAIN))
 DETAIL_LEADING = float(layout.get("DETAIL_LINE_LEADING", FS_MAIN + 2))
 ITEM_LEADING = float(layout.get("ITEM_Y_SEPARATION", FS_MAIN + 6))
 WRAP_CHARS = int(layout.get("WRAP_CHARS", 70))
+WRAP_WIDTH = layout.get("WRAP_WIDTH")
 
 # Pagination cutoff: if the next row would go below this Y, start a new page
 PAGE_BOTTOM_Y_CUTOFF = float(layout.get("PAGE_BOTTOM_Y_CUTOFF", 80 * mm))
+ROW_GAP = float(layout.get("ROW_GAP", 0.0))
+
+# Estimated vertical space consumed by one item block, indexed by "description is a dict":
+# title line only, or title line + 4 detail lines
+ITEM_HEIGHTS = (ITEM_LEADING + ROW_GAP, ITEM_LEADING + 4 * DETAIL_LEADING + ROW_GAP)
 
 
 # -----------------------------
 # Helpers
 # -----------------------------
 
+@functools.lru_cache(maxsize=None)
 def _resolve_font(alias_name: str, layout_value: Optional[str], bold: bool = False) -> str:
     """
     Returns a font name that ReportLab can use with setFont().
     - If layout_value is a path to .otf/.ttf and exists: register under alias_name and return alias_name.
     - If layout_value is a built-in font name (e.g. 'Helvetica', 'Times-Roman'): return it directly.
     - Otherwise, return a safe built-in fallback (Helvetica or Helvetica-Bold).
+    Results are memoized, so each font file is checked and registered once per process.
+    TTF files need no pre-subsetting: ReportLab only embeds the glyphs actually drawn.
     """
     # 1) If a valid font file path was provided -> register to alias and use alias
     if layout_value and isinstance(layout_value, str) and os.path.isfile(layout_value):
-        pdfmetrics.registerFont(TTFont(alias_name, layout_value))
+        # ReportLab keeps the first TTF registered under a name and ignores later ones,
+        # so only parse the file if the alias is still free (e.g. not set up by the host app)
+        if alias_name not in pdfmetrics.getRegisteredFontNames():
+            pdfmetrics.registerFont(TTFont(alias_name, layout_value))
         return alias_name
 
     # 2) If user provided a built-in font name, just use it
@@ -112,203 +133,299 @@ def _resolve_font(alias_name: str, layout_value: Optional[str], bold: bool = Fal
     return "Helvetica-Bold" if bold else "Helvetica"
 
 
+# DD-MM-YYYY / DD/MM/YYYY, or YYYY-MM-DD / YYYY/MM/DD (same separator twice)
+_DATE_RE = re.compile(
+    r"(?P<d>\d{1,2})(?P<s1>[-/])(?P<m>\d{1,2})(?P=s1)(?P<y>\d{4})"
+    r"|(?P<y2>\d{4})(?P<s2>[-/])(?P<m2>\d{1,2})(?P=s2)(?P<d2>\d{1,2})",
+    re.ASCII,
+)
+
+
+def _parse_date(s: str) -> datetime:
+    """Parses the date formats accepted in data["date"] with one regex match (no strptime probing)."""
+    m = _DATE_RE.fullmatch(s)
+    if m is not None:
+        d, mo, y = m.group("d", "m", "y") if m.group("d") else m.group("d2", "m2", "y2")
+        try:
+            return datetime(int(y), int(mo), int(d))
+        except ValueError:
+            pass  # e.g. 31-02-2025
+    raise ValueError("Unrecognized date format for 'date'. Try 'DD-MM-YYYY'.")
+
+
+class _Canvas(canvas.Canvas):
+    """
+    Canvas that skips setFont() when the requested font and size are already active.
+    Every setFont() otherwise emits a 'Tf' operator into the page content stream.
+    """
+
+    def setFont(self, psfontname, size, leading=None):
+        if leading is None and psfontname == self._fontname and size == self._fontsize:
+            return
+        super().setFont(psfontname, size, leading)
+
+    def drawText(self, aTextObject):
+        super().drawText(aTextObject)
+        # A Tf inside the text object stays in effect after ET: keep the tracked font in step
+        self._fontname = aTextObject._fontname
+        self._fontsize = aTextObject._fontsize
+        self._leading = aTextObject._leading
+
+
+@functools.lru_cache(maxsize=32)
+def _width_table(font: str, size: float) -> Tuple[float, ...]:
+    """Advance width (in points) of every ASCII character for font at size."""
+    return tuple(pdfmetrics.stringWidth(chr(i), font, size) for i in range(128))
+
+
+def _string_width(text: str, font: str, size: float) -> float:
+    """stringWidth() with a table lookup for plain ASCII text (amounts, refs, addresses)."""
+    if text.isascii():
+        tbl = _width_table(font, size)
+        return sum(tbl[ord(ch)] for ch in text)
+    return pdfmetrics.stringWidth(text, font, size)
+
+
+@functools.lru_cache(maxsize=4096)
+def _right_aligned_x(x_right: float, text: str, font: str, size: float) -> float:
+    """Start x for text ending at x_right. Cached: columns reuse the same x_right and many values repeat."""
+    return x_right - _string_width(text, font, size)
+
+
 def _draw_right_aligned(c: canvas.Canvas, x_right: float, y: float, text: str, font: str, size: int):
     c.setFont(font, size)
-    tw = c.stringWidth(text, font, size)
-    c.drawString(x_right - tw, y, text)
+    c.drawString(_right_aligned_x(x_right, text, font, size), y, text)
 
 
 def _draw_lines(c: canvas.Canvas, x: float, y_start: float, lines: List[str], leading: float, font: str, size: int):
     """
-    Draw lines downward (decreasing y). Returns the y below the last line.
+    Draw lines downward (decreasing y) as a single text object. Returns the y below the last line.
     """
-    c.setFont(font, size)
+    t = c.beginText(x, y_start)
+    t.setFont(font, size, leading)
     y = y_start
     for line in lines:
         if line is not None and str(line).strip() != "":
-            c.drawString(x, y, str(line))
+            t.textLine(str(line))
             y -= leading
+    c.drawText(t)
     return y
 
 
-def _draw_lines_right(c: canvas.Canvas,
-                      x_right: float,
-                      y_start: float,
-                      lines: List[str],
-                      leading: float,
-                      font: str,
-                      size: int):
-    c.setFont(font, size)
-    y = y_start
-    for line in lines:
-        if line is not None and str(line).strip() != "":
-            _draw_right_aligned(c, x_right, y, str(line), font, size)
-            y -= leading
-    return y
+@functools.lru_cache(maxsize=4096)
+def _currency_cached(n: float, sign: float) -> str:
+    return f"{n:,.2f}"
 
 
 def _currency(n: float) -> str:
-    return f"{n:,.2f}"
+    # Cached: prices and amounts repeat a lot across rows and across a batch.
+    # -0.0 == 0.0 (same hash), so the sign is part of the key to keep "-0.00" and "0.00" apart.
+    return _currency_cached(n, math.copysign(1.0, n))
 
 
-def _wrap_text(text: str, max_chars: int) -> List[str]:
-    """Simple greedy wrapper by character count (works fine for compact invoices)."""
+@functools.lru_cache(maxsize=1024)
+def _wrap_text(text: str, max_chars: int) -> Tuple[str, ...]:
+    """Greedy wrapper by character count (works fine for compact invoices). Cached: descriptions repeat a lot."""
     if text is None:
-        return []
+        return ()
     s = str(text).strip()
     if not s or max_chars <= 0:
-        return [s]
-    words = s.split()
+        return (s,)
+    # Collapse runs of whitespace (incl. tabs) to single spaces first, like the old split()/join loop
+    s = " ".join(s.split())
+    return tuple(textwrap.wrap(s, width=max_chars, break_long_words=False, break_on_hyphens=False)) or ("",)
+
+
+@functools.lru_cache(maxsize=1024)
+def _wrap_text_px(text: str, font: str, size: float, max_width: float) -> Tuple[str, ...]:
+    """
+    Greedy wrapper by rendered width. Each line's break is first guessed from the
+    average glyph width, then moved by whole words, so only a couple of widths
+    are measured per line instead of one per word.
+    """
+    words = str(text).split()
+    if not words:
+        return ("",)
+    avg = _string_width("abcdefghij ", font, size) / 11
+    budget = max(1, int(max_width / avg))  # estimated characters per line
+
     lines: List[str] = []
-    cur: List[str] = []
-    cur_len = 0
-    for w in words:
-        add = len(w) + (1 if cur else 0)
-        if cur_len + add <= max_chars:
-            cur.append(w)
-            cur_len += add
-        else:
-            lines.append(" ".join(cur))
-            cur = [w]
-            cur_len = len(w)
-    if cur:
-        lines.append(" ".join(cur))
-    return lines
+    i, n = 0, len(words)
+    while i < n:
+        # Estimate: take words while the character count stays within budget
+        j, chars = i + 1, len(words[i])
+        while j < n and chars + 1 + len(words[j]) <= budget:
+            chars += 1 + len(words[j])
+            j += 1
+        # Adjust: grow while the next word still fits, shrink while too wide (keep >= 1 word)
+        while j < n and _string_width(" ".join(words[i:j + 1]), font, size) <= max_width:
+            j += 1
+        while j > i + 1 and _string_width(" ".join(words[i:j]), font, size) > max_width:
+            j -= 1
+        lines.append(" ".join(words[i:j]))
+        i = j
+    return tuple(lines)
+
+
+def _key_int(k: str) -> int:
+    try:
+        return int(k)
+    except Exception:
+        return 10**9
+
+
+def _item_columns(items: Union[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]
+                  ) -> Tuple[List[str], List[Any], List[float], List[float]]:
+    """
+    Splits data["items"] into parallel columns (keys, descriptions, quantities, prices).
+    - dict {"1": {...}, "2": {...}}: ordered by numeric key.
+    - list [{...}, {...}]: already in order, numbered from 1 (no sorting, no key parsing).
+    """
+    if isinstance(items, dict):
+        keys = sorted(items.keys(), key=_key_int)
+        rows = [items[k] for k in keys]
+    else:
+        rows = list(items)
+        keys = [str(i) for i in range(1, len(rows) + 1)]
+    descs = [it.get("description") for it in rows]
+    qtys = [float(it.get("quantity", 0.0)) for it in rows]
+    prices = [float(it.get("price", 0.0)) for it in rows]
+    return keys, descs, qtys, prices
 
 
 # -----------------------------
 # Core generator
 # -----------------------------
 
-def generate_invoice(data: Dict[str, Any],
-                     blank_pdf_path: str,
-                     output_path: str,
-                     due_in: int = 7):
+class _InvoiceRenderer:
     """
-    data: {
-      "customer_info": {...},
-      "invoice_ref": "...",
-      "date": <datetime or str>,
-      "items": { "1": { "description": dict|str, "quantity": float, "price": float }, ... },
-      "vat": 0.2
-    }
-
-    layout: hyperparameters controlling every placement & font. See example at bottom.
+    Holds everything that does not depend on the invoice data: the parsed blank
+    template, its page size and the resolved fonts. Build one and call render()
+    repeatedly to avoid re-parsing the template for every invoice.
     """
 
-    # -------- Fonts (from layout) --------
-    main_reg = _resolve_font("MainFont", layout.get("MAIN_FONT_REGULAR"), bold=False)
-    main_bold = _resolve_font("MainFont-Bold", layout.get("MAIN_FONT_BOLD"), bold=True)
-    acc_reg = _resolve_font("AccentFont", layout.get("ACCENT_FONT_REGULAR"), bold=False)
-    acc_bold = _resolve_font("AccentFont-Bold", layout.get("ACCENT_FONT_BOLD"), bold=True)
-
-    # -------- Load page size from blank --------
-    reader_blank = PdfReader(blank_pdf_path)
-    first_page = reader_blank.pages[0]
-    page_w = float(first_page.mediabox.width)
-    page_h = float(first_page.mediabox.height)
-
-    # -------- Parse dates --------
-    dt = data["date"]
-    if isinstance(dt, str):
-        parsed = None
-        for fmt in ("%d-%m-%Y", "%Y-%m-%d", "%d/%m/%Y", "%Y/%m/%d"):
-            try:
-                parsed = datetime.strptime(dt, fmt)
-                break
-            except ValueError:
-                continue
-        if parsed is None:
-            raise ValueError("Unrecognized date format for 'date'. Try 'DD-MM-YYYY'.")
-        dt = parsed
-    due_dt = dt + timedelta(days=due_in)
-
-    # -------- Prepare items (sorted by numeric key) --------
-    def _key_int(k: str) -> int:
-        try:
-            return int(k)
-        except Exception:
-            return 10**9
-
-    items_sorted = [(k, data["items"][k]) for k in sorted(data["items"].keys(), key=_key_int)]
-
-    # -------- Overlay canvas setup --------
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    overlay_path = os.path.join(os.path.dirname(output_path) or ".", "_overlay_tmp.pdf")
-    c = canvas.Canvas(overlay_path, pagesize=(page_w, page_h))
-
-    # -------- Pagination: split items into pages --------
-    def estimate_item_height(it: Dict[str, Any]) -> float:
-        """Estimate vertical space consumed by one item block."""
-        h = 0.0
-        # Title line
-        h += ITEM_LEADING
-        # If dict description, add 4 detail lines
-        desc = it.get("description")
-        if isinstance(desc, dict):
-            h += 4 * DETAIL_LEADING
-        return h
-
-    pages: List[List[Tuple[str, Dict[str, Any]]]] = []
-    cur_page: List[Tuple[str, Dict[str, Any]]] = []
-    cur_y = Y_FIRST_ITEM
-
-    for k, it in items_sorted:
-        need_h = estimate_item_height(it) + layout.get("ROW_GAP", 0.0)
-        # If this item would cross the bottom cutoff, start a new page
-        if cur_page and (cur_y - need_h < PAGE_BOTTOM_Y_CUTOFF):
-            pages.append(cur_page)
-            cur_page = []
-            cur_y = Y_FIRST_ITEM
-        cur_page.append((k, it))
-        cur_y -= need_h
-    if cur_page:
-        pages.append(cur_page)
-
-    # -------- Draw pages --------
-    subtotal = 0.0
-
-    def draw_header_info():
-        """Draws invoice & client blocks (NOT the headings)."""
-        # Invoice info (left-aligned)
-        c.setFont(main_reg, FS_MAIN)
-        c.drawString(INV_X, INV_Y, f"Invoice #: {data['invoice_ref']}")
-        c.drawString(INV_X, INV_Y - (FS_MAIN + 2), f"Date: {dt.strftime('%d/%m/%Y')}")
-        c.drawString(INV_X, INV_Y - 2*(FS_MAIN + 2), f"Due: {due_dt.strftime('%d/%m/%Y')}")
-
-        # Client info (RIGHT-aligned to CLI_X_RIGHT)
+    def __init__(self, blank_pdf_path: Union[str, os.PathLike, BinaryIO]):
+        # -------- Fonts (from layout) --------
+        self.main_reg = _resolve_font("MainFont", layout.get("MAIN_FONT_REGULAR"), bold=False)
+        self.main_bold = _resolve_font("MainFont-Bold", layout.get("MAIN_FONT_BOLD"), bold=True)
+        self.acc_reg = _resolve_font("AccentFont", layout.get("ACCENT_FONT_REGULAR"), bold=False)
+        self.acc_bold = _resolve_font("AccentFont-Bold", layout.get("ACCENT_FONT_BOLD"), bold=True)
+
+        # -------- Load blank template (kept as bytes) and its page size --------
+        if isinstance(blank_pdf_path, (str, os.PathLike)):
+            with open(blank_pdf_path, "rb") as f:
+                self.blank_pdf_bytes = f.read()
+        else:
+            self.blank_pdf_bytes = blank_pdf_path.read()
+        first_page = PdfReader(fdata=self.blank_pdf_bytes).pages[0]
+        x0, y0, x1, y1 = (float(v) for v in first_page.inheritable.MediaBox)
+        self.page_w = x1 - x0
+        self.page_h = y1 - y0
+
+    def render(self, data: Dict[str, Any], output_path: str, due_in: int = 7):
+        """Render one invoice (see generate_invoice for the data format) to output_path."""
+        main_reg, main_bold, acc_bold = self.main_reg, self.main_bold, self.acc_bold
+        page_w, page_h = self.page_w, self.page_h
+
+        # -------- Parse dates --------
+        dt = data["date"]
+        if isinstance(dt, str):
+            dt = _parse_date(dt)
+        due_dt = dt + timedelta(days=due_in)
+
+        # -------- Prepare items (one column per field; amounts computed once) --------
+        keys, descs, qtys, prices = _item_columns(data["items"])
+        amounts = [q * p for q, p in zip(qtys, prices)]
+        subtotal = sum(amounts)
+
+        # -------- Canvas setup (drawn straight into the output file) --------
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        c = _Canvas(os.fspath(output_path), pagesize=(page_w, page_h))
+
+        # -------- Blank template, painted under each page as a Form XObject --------
+        # pdfrw tags converted objects with the target document, so every canvas gets
+        # its own parse of the template (from the cached bytes, well under a millisecond)
+        blank_pages = PdfReader(fdata=self.blank_pdf_bytes).pages
+        blank_forms: Dict[int, str] = {}
+
+        def draw_template(page_idx: int):
+            """Paints blank page page_idx (or the last one); each form is embedded once per document."""
+            i = min(page_idx, len(blank_pages) - 1)
+            if i not in blank_forms:
+                blank_forms[i] = makerl(c, pagexobj(blank_pages[i]))
+            c.doForm(blank_forms[i])
+
+        # -------- Header blocks: identical on every page, so built and measured once --------
+        header_leading = FS_MAIN + 2
+        invoice_lines = [
+            f"Invoice #: {data['invoice_ref']}",
+            f"Date: {dt.strftime('%d/%m/%Y')}",
+            f"Due: {due_dt.strftime('%d/%m/%Y')}",
+        ]
         cust = data.get("customer_info", {})
-        lines = [
+        client_lines = [
             cust.get("name", ""),
             cust.get("VAT") if cust.get("VAT") else "",
             cust.get("address_line_1", ""),
             cust.get("address_line_2", "") if cust.get("address_line_2", "") else "",
             " ".join(v for v in [cust.get("city", ""), cust.get("post_code", "")] if v) + ", " + cust.get("country", "")
         ]
-        _draw_lines_right(c, CLI_X_RIGHT, CLI_Y_TOP, [ln for ln in lines if ln], FS_MAIN + 2, main_reg, FS_MAIN)
-
-    for page_idx, page_items in enumerate(pages):
-        # Header info on each page
+        client_lines = [str(ln) for ln in client_lines if ln and str(ln).strip()]
+        client_xs = [_right_aligned_x(CLI_X_RIGHT, ln, main_reg, FS_MAIN) for ln in client_lines]
+
+        def draw_header_info():
+            """Draws invoice & client blocks (NOT the headings) as one text object."""
+            # Invoice info (left-aligned)
+            t = c.beginText(INV_X, INV_Y)
+            t.setFont(main_reg, FS_MAIN, header_leading)
+            t.textLines(invoice_lines)
+
+            # Client info (RIGHT-aligned to CLI_X_RIGHT)
+            y = CLI_Y_TOP
+            for ln, x in zip(client_lines, client_xs):
+                t.setTextOrigin(x, y)
+                t.textOut(ln)
+                y -= header_leading
+            c.drawText(t)
+
+        # Item loop is the hot path: bind globals and bound methods to locals once
+        begin_text, draw_text = c.beginText, c.drawText
+        currency, right_x = _currency, _right_aligned_x
+        item_heights, y_first, y_cutoff, sep_item = ITEM_HEIGHTS, Y_FIRST_ITEM, PAGE_BOTTOM_Y_CUTOFF, SEP_ITEM
+        x_item, x_desc, x_qty, x_price, x_amount = X_ITEM, X_DESC, X_QTY, X_PRICE, X_AMOUNT
+        fs, detail_leading, mr, mb = FS_MAIN, DETAIL_LEADING, main_reg, main_bold
+        wrap_width = float(WRAP_WIDTH) if WRAP_WIDTH else None
+
+        # -------- Draw pages (paginating as items are drawn) --------
+        page_idx = 0
+        draw_template(page_idx)
         draw_header_info()
-
-        # Draw items on this page
-        y = Y_FIRST_ITEM
-        for (k, it) in page_items:
-            desc = it.get("description")
-            qty = float(it.get("quantity", 0.0))
-            price = float(it.get("price", 0.0))
-            amount = qty * price
-            subtotal += amount
-
-            # Left cols
-            c.setFont(main_reg, FS_MAIN)
-            c.drawString(X_ITEM, y, str(k))
-
-            if isinstance(desc, dict):
+        y = y_first
+        cur_y = y_first  # estimated fill of the current page (drives pagination)
+        for idx, k in enumerate(keys):
+            desc, qty, price, amount = descs[idx], qtys[idx], prices[idx], amounts[idx]
+            is_dict = isinstance(desc, dict)
+
+            # If this item would cross the bottom cutoff, start a new page (header info on each page)
+            need_h = item_heights[is_dict]
+            if y < y_first and cur_y - need_h < y_cutoff:
+                c.showPage()
+                page_idx += 1
+                draw_template(page_idx)
+                draw_header_info()
+                y = cur_y = y_first
+            cur_y -= need_h
+
+            # One text object per row: a single BT..ET block, with Tf only where the font changes
+            t = begin_text(x_item, y)
+            t.setFont(mr, fs)
+            t.textOut(str(k))
+
+            if is_dict:
                 # Title (bold)
-                title = desc.get("project_name", "")
-                c.setFont(main_bold, FS_MAIN)
-                c.drawString(X_DESC, y, title)
+                t.setFont(mb, fs)
+                t.setTextOrigin(x_desc, y)
+                t.textOut(desc.get("project_name", ""))
                 # Details (regular)
                 meta = [
                     f"Size: {desc.get('size','')}",
@@ -316,70 +433,121 @@ def generate_invoice(data: Dict[str, Any],
                     f"Surface: {desc.get('surface','')} m²",
                     f"Weight: {desc.get('weight','')} kg",
                 ]
-                _draw_lines(c, X_DESC, y - (FS_MAIN + 2), meta, DETAIL_LEADING, main_reg, FS_MAIN)
+                t.setFont(mr, fs, detail_leading)
+                t.setTextOrigin(x_desc, y - (fs + 2))
+                t.textLines(meta)
             else:
                 # Single-line (wrap if needed)
-                c.setFont(main_bold, FS_MAIN)
-                for i, line in enumerate(_wrap_text(str(desc), WRAP_CHARS)):
-                    c.drawString(X_DESC, y - i * DETAIL_LEADING, line)
+                if wrap_width:
+                    desc_lines = _wrap_text_px(str(desc), mb, fs, wrap_width)
+                else:
+                    desc_lines = _wrap_text(str(desc), WRAP_CHARS)
+                t.setFont(mb, fs, detail_leading)
+                t.setTextOrigin(x_desc, y)
+                t.textLines(desc_lines)
+                t.setFont(mr, fs)
 
             # Qty / Price / Amount (amount right-aligned)
-            c.setFont(main_reg, FS_MAIN)
-            c.drawString(X_QTY, y, f"{qty:g}")
-            c.drawString(X_PRICE, y, _currency(price))
-            _draw_right_aligned(c, X_AMOUNT, y, _currency(amount), main_reg, FS_MAIN)
+            t.setTextOrigin(x_qty, y)
+            t.textOut(f"{qty:g}")
+            t.setTextOrigin(x_price, y)
+            t.textOut(currency(price))
+            amount_str = currency(amount)
+            t.setTextOrigin(right_x(x_amount, amount_str, mr, fs), y)
+            t.textOut(amount_str)
+            draw_text(t)
 
             # Advance Y to next row
-            y -= SEP_ITEM
+            y -= sep_item
 
-        # If last page, add VAT/TOTAL and banking info
-        is_last = (page_idx == len(pages) - 1)
-        if is_last:
-            vat_amount = subtotal * float(data.get("vat", 0.0))
-            total_amount = subtotal + vat_amount
+        # Last page: add VAT/TOTAL and banking info
+        vat_amount = subtotal * float(data.get("vat", 0.0))
+        total_amount = subtotal + vat_amount
 
-            y_vat = y - SEP_LAST_VAT
-            y_total = y_vat - SEP_VAT_TOTAL
-            y_bank = y_total - SEP_TOTAL_BANK
+        y_vat = y - SEP_LAST_VAT
+        y_total = y_vat - SEP_VAT_TOTAL
+        y_bank = y_total - SEP_TOTAL_BANK
 
-            c.setFont(acc_bold, FS_MAIN)
-            c.drawString(X_PRICE, y_vat, f"VAT ({int(round(float(data['vat'])*100))}%)")
-            _draw_right_aligned(c, X_AMOUNT, y_vat, _currency(vat_amount), acc_bold, FS_MAIN)
+        c.setFont(acc_bold, FS_MAIN)
+        c.drawString(X_PRICE, y_vat, f"VAT ({int(round(float(data['vat'])*100))}%)")
+        _draw_right_aligned(c, X_AMOUNT, y_vat, _currency(vat_amount), acc_bold, FS_MAIN)
 
-            c.drawString(X_PRICE, y_total, "TOTAL")
-            _draw_right_aligned(c, X_AMOUNT, y_total, _currency(total_amount), acc_bold, FS_MAIN)
+        c.drawString(X_PRICE, y_total, "TOTAL")
+        _draw_right_aligned(c, X_AMOUNT, y_total, _currency(total_amount), acc_bold, FS_MAIN)
 
-            # Banking info (accent regular)
-            c.setFont(acc_reg, FS_MAIN)
-            _draw_lines(c, BANK_X, y_bank, BANK_LINES, FS_MAIN + 2, acc_bold, FS_MAIN)
+        # Banking info (accent font)
+        _draw_lines(c, BANK_X, y_bank, BANK_LINES, FS_MAIN + 2, acc_bold, FS_MAIN)
 
         c.showPage()
+        c.save()
+
+
+def generate_invoice(data: Dict[str, Any],
+                     blank_pdf_path: str,
+                     output_path: str,
+                     due_in: int = 7):
+    """
+    data: {
+      "customer_info": {...},
+      "invoice_ref": "...",
+      "date": <datetime or str>,
+      "items": { "1": { "description": dict|str, "quantity": float, "price": float }, ... },
+               (or a list of the same item dicts, already in order and numbered from 1)
+      "vat": 0.2
+    }
 
-    c.save()
+    layout: hyperparameters controlling every placement & font. See example at bottom.
+    """
+    _InvoiceRenderer(blank_pdf_path).render(data, output_path, due_in=due_in)
 
-    # -------- Merge overlay with blank (PyPDF2) --------
-    reader_overlay = PdfReader(overlay_path)
-    writer = PdfWriter()
 
-    blank_count = len(reader_blank.pages)
-    overlay_count = len(reader_overlay.pages)
+def generate_invoices_batch(data_list: List[Dict[str, Any]],
+                            blank_pdf_path: str,
+                            output_paths: List[str],
+                            due_in: int = 7):
+    """
+    Same as generate_invoice, for many invoices at once. The blank template is
+    parsed and the fonts are resolved only once for the whole batch.
+    """
+    if len(data_list) != len(output_paths):
+        raise ValueError("data_list and output_paths must have the same length.")
+    renderer = _InvoiceRenderer(blank_pdf_path)
+    for data, output_path in zip(data_list, output_paths):
+        renderer.render(data, output_path, due_in=due_in)
 
-    for i in range(overlay_count):
-        base = reader_blank.pages[min(i, blank_count - 1)]
-        # Deep-copy so we don't mutate the original template page across iterations
-        page = copy.deepcopy(base)
-        page.merge_page(reader_overlay.pages[i])
-        writer.add_page(page)
 
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    with open(output_path, "wb") as f_out:
-        writer.write(f_out)
+# Renderer of the current worker process (set up by _init_worker)
+_worker_renderer: Optional[_InvoiceRenderer] = None
+
+
+def _init_worker(blank_pdf_bytes: bytes):
+    global _worker_renderer
+    _worker_renderer = _InvoiceRenderer(io.BytesIO(blank_pdf_bytes))
+
+
+def _generate_one(job: Tuple[Dict[str, Any], str, int]):
+    data, output_path, due_in = job
+    _worker_renderer.render(data, output_path, due_in=due_in)
+
+
+def generate_invoices_parallel(datasets: List[Dict[str, Any]],
+                               blank_pdf_path: str,
+                               output_paths: List[str],
+                               workers: Optional[int] = None,
+                               due_in: int = 7):
+    """
+    Same as generate_invoices_batch, spread over a pool of worker processes
+    (workers=None -> one per CPU). The blank template is read once here and
+    each worker builds its renderer from those bytes when it starts.
+    """
+    if len(datasets) != len(output_paths):
+        raise ValueError("datasets and output_paths must have the same length.")
+    with open(blank_pdf_path, "rb") as f:
+        blank_pdf_bytes = f.read()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(blank_pdf_bytes,)) as ex:
+        # list() so that errors raised in workers propagate here
+        list(ex.map(_generate_one, zip(datasets, output_paths, itertools.repeat(due_in)), chunksize=4))
 
-    try:
-        os.remove(overlay_path)
-    except FileNotFoundError:
-        pass
 
 # -----------------------------
 # Example usage / defaults